@@ -34,5 +34,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     mac = entry.data.get(CONF_MAC)
     if unload_ok and mac in hass.data.get(DOMAIN, {}):
-        hass.data[DOMAIN].pop(mac)
+        instance = hass.data[DOMAIN].pop(mac)
+        await instance.disconnect()
     return unload_ok
\ No newline at end of file
@@ -16,6 +16,24 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+_DEFAULT_SOURCES = ["Bluetooth", "AUX", "USB", "TF Card", "PC Audio"]
+_SOURCES_SELECTOR = cv.multi_select({source: source for source in _DEFAULT_SOURCES})
+
+# Static schemas are built once; voluptuous compiles them on construction.
+_USER_BASE_SCHEMA = vol.Schema({vol.Optional(CONF_NAME): str})
+_MANUAL_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_NAME): str,
+        vol.Required(CONF_MAC): str,
+    }
+)
+_SOURCES_SCHEMA = vol.Schema(
+    {
+        vol.Optional("auto_scan", default=False): bool,
+        vol.Optional("sources", default=_DEFAULT_SOURCES): _SOURCES_SELECTOR,
+    }
+)
+
 
 async def perform_auto_scan(hass: HomeAssistant, mac: str) -> list[str]:
     """Perform auto scan of sources using SinilinkInstance."""
@@ -90,6 +108,12 @@ class SinilinkConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._discovered: list[tuple[str, str]] | None = None
+        self._device_choices: dict[str, str] | None = None
+        self._user_schema: vol.Schema | None = None
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
@@ -99,13 +123,15 @@ class SinilinkConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_user(self, user_input: dict[str, Any] | None = None):
         """Handle the initial step."""
         errors = {}
-        discovered_devices = []
 
-        # Try to discover BLE devices using HA Bluetooth API
-        ble_devices = bluetooth.async_discovered_service_info(self.hass)
-        for dev in ble_devices:
-            if dev.name and dev.name.startswith("Sinilink-APP"):
-                discovered_devices.append((dev.address, dev.name))
+        # Try to discover BLE devices using HA Bluetooth API, once per flow
+        if self._discovered is None:
+            self._discovered = [
+                (dev.address, dev.name)
+                for dev in bluetooth.async_discovered_service_info(self.hass)
+                if dev.name and dev.name.startswith("Sinilink-APP")
+            ]
+        discovered_devices = self._discovered
 
         if user_input is not None:
             if discovered_devices and user_input.get(CONF_MAC) == "manual":
@@ -116,19 +142,18 @@ class SinilinkConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return await self.async_step_sources()
 
         if discovered_devices:
-            device_choices = {
-                f"{name} ({mac})": mac for mac, name in discovered_devices
-            }
-            device_choices["Enter MAC manually"] = "manual"
-            schema = vol.Schema(
-                {
-                    vol.Optional(CONF_NAME): str,
-                    vol.Required(CONF_MAC): vol.In(list(device_choices.values())),
+            if self._device_choices is None:
+                self._device_choices = {
+                    f"{name} ({mac})": mac for mac, name in discovered_devices
                 }
-            )
+                self._device_choices["Enter MAC manually"] = "manual"
+                self._user_schema = _USER_BASE_SCHEMA.extend(
+                    {vol.Required(CONF_MAC): vol.In(list(self._device_choices.values()))}
+                )
+            device_choices = self._device_choices
             return self.async_show_form(
                 step_id="user",
-                data_schema=schema,
+                data_schema=self._user_schema,
                 description_placeholders={"devices": "\n".join(device_choices.keys())},
                 errors=errors,
             )
@@ -142,15 +167,9 @@ class SinilinkConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self.name = user_input.get(CONF_NAME, "")
             self.mac = user_input[CONF_MAC]
             return await self.async_step_sources()
-        schema = vol.Schema(
-            {
-                vol.Optional(CONF_NAME): str,
-                vol.Required(CONF_MAC): str,
-            }
-        )
         return self.async_show_form(
             step_id="manual",
-            data_schema=schema,
+            data_schema=_MANUAL_SCHEMA,
             errors=errors,
         )
 
@@ -171,15 +190,7 @@ class SinilinkConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 },
             )
 
-        schema = vol.Schema(
-            {
-                vol.Optional("auto_scan", default=False): bool,
-                vol.Optional("sources", default=["Bluetooth", "AUX", "USB", "TF Card", "PC Audio"]): cv.multi_select(
-                    {"Bluetooth": "Bluetooth", "AUX": "AUX", "USB": "USB", "TF Card": "TF Card", "PC Audio": "PC Audio"}
-                ),
-            }
-        )
-        return self.async_show_form(step_id="sources", data_schema=schema)
+        return self.async_show_form(step_id="sources", data_schema=_SOURCES_SCHEMA)
 
 
 class SinilinkOptionsFlowHandler(config_entries.OptionsFlow):
@@ -188,6 +199,21 @@ class SinilinkOptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self._config_entry = config_entry
+        self._schema_sources: tuple[str, ...] | None = None
+        self._schema: vol.Schema | None = None
+
+    def _options_schema(self, default_sources: list[str]) -> vol.Schema:
+        """Return the options schema, rebuilding it only if the defaults changed."""
+        key = tuple(default_sources)
+        if self._schema is None or key != self._schema_sources:
+            self._schema_sources = key
+            self._schema = vol.Schema(
+                {
+                    vol.Optional("auto_scan", default=False): bool,
+                    vol.Optional("sources", default=list(key)): _SOURCES_SELECTOR,
+                }
+            )
+        return self._schema
 
     async def async_step_init(self, user_input: dict[str, Any] | None = None):
         """Manage options."""
@@ -201,17 +227,10 @@ class SinilinkOptionsFlowHandler(config_entries.OptionsFlow):
             return self.async_create_entry(title="", data={"sources": sources})
 
         default_sources = self._config_entry.options.get(
-            "sources", self._config_entry.data.get("sources", ["Bluetooth", "AUX", "USB", "TF Card", "PC Audio"])
+            "sources", self._config_entry.data.get("sources", _DEFAULT_SOURCES)
         )
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional("auto_scan", default=False): bool,
-                    vol.Optional("sources", default=default_sources): cv.multi_select(
-                        {"Bluetooth": "Bluetooth", "AUX": "AUX", "USB": "USB", "TF Card": "TF Card", "PC Audio": "PC Audio"}
-                    ),
-                }
-            ),
+            data_schema=self._options_schema(default_sources),
         )
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Support for Sinilink Amplifier media player."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -14,9 +15,11 @@ from homeassistant.components.media_player import (
     PLATFORM_SCHEMA,
 )
 from homeassistant.const import CONF_MAC, CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.helpers.restore_state import RestoreEntity
 
@@ -26,6 +29,9 @@ DOMAIN = "sinilink"
 
 _LOGGER = logging.getLogger(__name__)
 
+# Volume changes arriving within this window are coalesced into one write.
+VOLUME_DEBOUNCE = 0.15
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
     vol.Optional(CONF_NAME): cv.string,
     vol.Required(CONF_MAC): cv.string,
@@ -80,21 +86,57 @@ class SinilinkAmplifier(MediaPlayerEntity, RestoreEntity):
         | MediaPlayerEntityFeature.NEXT_TRACK
         | MediaPlayerEntityFeature.PREVIOUS_TRACK
     )
+    _SOURCE_COMMANDS = {
+        "AUX": SinilinkInstance.aux,
+        "Bluetooth": SinilinkInstance.bluetooth,
+        "USB": SinilinkInstance.usb,
+        "TF Card": SinilinkInstance.tf_card,
+        "PC Audio": SinilinkInstance.pc_audio,
+    }
+
     def __init__(self, name, amp_instance, sources=None):
         """Initialize a SinilinkAmplifier."""
         self._amp = amp_instance
         self._name = name
         self._hass = amp_instance.hass
+        self._attr_unique_id = amp_instance.mac
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, amp_instance.mac)},
+            name=name,
+            manufacturer="Sinilink",
+            model="Amplifier",
+            connections={("mac", amp_instance.mac)},
+        )
         self._attr_state = MediaPlayerState.OFF
         if sources is None:
             sources = ["AUX", "Bluetooth", "USB", "TF Card", "PC Audio"]
-        self._source_list = set(sources)
+        self._source_list = tuple(sorted(set(sources)))
         self._source = getattr(self._amp, "source", "AUX")
         self._muted = False
         self._media_volume_level = 0.0
         self._saved_volume_level = 0.1
         self._volume_max = 28
-        self._amp.register_callback(self.async_schedule_update_ha_state)
+        self._pending_volume: float | None = None
+        self._cancel_volume_timer: CALLBACK_TYPE | None = None
+        self._volume_task: asyncio.Task | None = None
+        self._amp.register_callback(self._handle_amp_update)
+
+    def _refresh_state(self) -> None:
+        """Recompute the cached state from the amplifier."""
+        if not self._amp.is_on:
+            self._attr_state = MediaPlayerState.OFF
+        elif getattr(self._amp, "_is_playing", False):
+            self._attr_state = MediaPlayerState.PLAYING
+        else:
+            self._attr_state = MediaPlayerState.PAUSED
+
+    @callback
+    def _handle_amp_update(self) -> None:
+        """Handle a state update pushed by the amplifier."""
+        self._refresh_state()
+        # The callback is registered in __init__, before the entity is added.
+        if self.hass is not None:
+            self.async_write_ha_state()
 
     @property
     def name(self) -> str:
@@ -104,7 +146,7 @@ class SinilinkAmplifier(MediaPlayerEntity, RestoreEntity):
     @property
     def source_list(self):
         """Return the list of available input sources."""
-        return sorted(self._source_list)
+        return self._source_list
 
     @property
     def source(self) -> str:
@@ -121,20 +163,11 @@ class SinilinkAmplifier(MediaPlayerEntity, RestoreEntity):
         """Return the current sound mode."""
         return self._amp.eq_mode
 
-    @property
-    def state(self) -> MediaPlayerState | None:
-        """Return the state of the media player."""
-        if not self._amp.is_on:
-            return MediaPlayerState.OFF
-            
-        if getattr(self._amp, "_is_playing", False):
-            return MediaPlayerState.PLAYING
-            
-        return MediaPlayerState.PAUSED
-
     @property
     def volume_level(self):
         """Return volume level of the media player (0..1)."""
+        if self._pending_volume is not None:
+            return self._pending_volume
         if self._amp.volume is not None:
             return self._amp.volume / self._volume_max
         return 0.0
@@ -144,22 +177,6 @@ class SinilinkAmplifier(MediaPlayerEntity, RestoreEntity):
         """Boolean if volume is currently muted."""
         return self._muted
 
-    @property
-    def device_info(self):
-        """Return device information for device registry."""
-        return {
-            "identifiers": {(DOMAIN, self._amp.mac)},
-            "name": self._name,
-            "manufacturer": "Sinilink",
-            "model": "Amplifier",
-            "connections": {("mac", self._amp.mac)},
-        }
-
-    @property
-    def unique_id(self):
-        """Return a unique ID for this entity."""
-        return self._amp.mac
-
     async def async_added_to_hass(self) -> None:
         """Restore last known state on HA startup."""
         await super().async_added_to_hass()
@@ -169,7 +186,6 @@ class SinilinkAmplifier(MediaPlayerEntity, RestoreEntity):
 
         # Restore power
         is_on = last_state.state in (MediaPlayerState.ON, MediaPlayerState.PLAYING, MediaPlayerState.PAUSED)
-        self._attr_state = MediaPlayerState.ON if is_on else MediaPlayerState.OFF
 
         # Restore volume
         vol_level = last_state.attributes.get("volume_level")
@@ -199,27 +215,87 @@ class SinilinkAmplifier(MediaPlayerEntity, RestoreEntity):
             volume=int(round(self._media_volume_level * self._volume_max)),
             eq_mode=snd,
         )
+        self._refresh_state()
 
         self.async_write_ha_state()
 
     async def async_turn_off(self):
         """Turn AMP power off."""
+        self._cancel_pending_volume()
         await self._amp.turn_off()
-        self.async_schedule_update_ha_state()
+        self._refresh_state()
+        self.async_write_ha_state()
 
     async def async_turn_on(self):
         """Turn AMP power on."""
-        await self._amp.turn_on()
-        self.async_schedule_update_ha_state()
+        # Any non-zero volume frame powers the amplifier on, so a volume set
+        # just before turn-on is sent in place of the saved one.
+        volume = self._pending_volume
+        self._cancel_pending_volume()
+        new_vol_int = int(round(volume * self._volume_max)) if volume is not None else 0
+        if new_vol_int > 0:
+            await self._amp.set_volume(new_vol_int)
+        else:
+            await self._amp.turn_on()
+        self._refresh_state()
+        self.async_write_ha_state()
 
     async def async_set_volume_level(self, volume: float):
-        """Set AMP volume (0 to 1)."""
-        new_vol_int = int(round(volume * self._volume_max))
-        _LOGGER.debug("Set volume %s, native: %s", volume, new_vol_int)
-
-        await self._amp.set_volume(new_vol_int)
+        """Set AMP volume (0 to 1), coalescing rapid changes."""
+        self._pending_volume = volume
         self._media_volume_level = volume
-        self.async_schedule_update_ha_state()
+        if self._cancel_volume_timer is None:
+            self._cancel_volume_timer = async_call_later(
+                self._hass, VOLUME_DEBOUNCE, self._schedule_volume_flush
+            )
+        self.async_write_ha_state()
+
+    @callback
+    def _schedule_volume_flush(self, _now) -> None:
+        """Start sending the latest pending volume."""
+        self._cancel_volume_timer = None
+        # A running flush picks up the new value once its current write is done.
+        if self._volume_task is None:
+            self._volume_task = self._hass.async_create_task(self._flush_volume())
+
+    async def _flush_volume(self) -> None:
+        """Send the latest pending volume to the amplifier."""
+        try:
+            while (volume := self._pending_volume) is not None:
+                new_vol_int = int(round(volume * self._volume_max))
+                _LOGGER.debug("Set volume %s, native: %s", volume, new_vol_int)
+
+                try:
+                    await self._amp.set_volume(new_vol_int)
+                except Exception as e:
+                    _LOGGER.error("Failed to set volume on %s: %s", self._amp.mac, e)
+                if self._pending_volume == volume:
+                    self._pending_volume = None
+            self.async_write_ha_state()
+        finally:
+            if self._volume_task is asyncio.current_task():
+                self._volume_task = None
+
+    @callback
+    def _cancel_pending_volume(self) -> None:
+        """Drop a volume change that has not been sent yet.
+
+        A flush already in flight finishes its current write and then stops,
+        since there is no pending value left; the write lock orders any
+        following power frame after it.
+        """
+        self._pending_volume = None
+        if self._cancel_volume_timer is not None:
+            self._cancel_volume_timer()
+            self._cancel_volume_timer = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel pending and in-flight volume writes."""
+        self._cancel_pending_volume()
+        if self._volume_task is not None:
+            self._volume_task.cancel()
+            self._volume_task = None
+        await super().async_will_remove_from_hass()
 
     async def async_volume_up(self) -> None:
         """Volume up the media player."""
@@ -243,60 +319,57 @@ class SinilinkAmplifier(MediaPlayerEntity, RestoreEntity):
             _LOGGER.debug("Unmute")
 
         self._muted = mute
-        self.async_schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def async_select_source(self, source):
         """Select input source."""
         _LOGGER.debug("Set source %s", source)
-        if source == "AUX":
-            await self._amp.aux()
-        elif source == "Bluetooth":
-            await self._amp.bluetooth()
-        elif source == "USB":
-            await self._amp.usb()
-        elif source == "TF Card":
-            await self._amp.tf_card()
-        elif source == "PC Audio":
-            await self._amp.pc_audio()
+        command = self._SOURCE_COMMANDS.get(source)
+        if command is not None:
+            await command(self._amp)
 
         # Do not update self._source optimistically here.
         # We rely on the amp's 0F notification to confirm the source change.
         # This acts as safe dynamic discovery: if the amp doesn't support the source,
         # it ignores the command, no notification is sent, and the UI snaps back.
-        self.async_schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def async_select_sound_mode(self, sound_mode):
         """Select sound mode."""
         _LOGGER.debug("Set sound mode %s", sound_mode)
         await self._amp.set_eq_mode(sound_mode)
-        self.async_schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def async_media_play(self):
         """Send play command."""
         await self._amp.play()
-        self.async_schedule_update_ha_state()
+        self._refresh_state()
+        self.async_write_ha_state()
 
     async def async_media_pause(self):
         """Send pause command."""
         await self._amp.pause()
-        self.async_schedule_update_ha_state()
+        self._refresh_state()
+        self.async_write_ha_state()
 
     async def async_media_next_track(self):
         """Send next track command."""
         await self._amp.next_track()
-        self.async_schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def async_media_previous_track(self):
         """Send previous track command."""
         await self._amp.previous_track()
-        self.async_schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def async_update(self) -> None:
         """Watchdog to maintain connection and update state."""
         if getattr(self._amp, "_device", None) and self._amp._device.is_connected:
+            self._refresh_state()
             return
 
         _LOGGER.debug("Attempting to connect to %s", self._amp.mac)
         await self._amp.connect()
-        
-        self.async_schedule_update_ha_state()
+        self._refresh_state()
+
+        self.async_write_ha_state()
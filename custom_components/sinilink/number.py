@@ -6,6 +6,7 @@ import logging
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.const import CONF_MAC, CONF_NAME
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
@@ -56,13 +57,13 @@ class SinilinkVolumeStepNumber(NumberEntity, RestoreEntity):
         """Initialize the number entity."""
         self._amp = amp_instance
         self._attr_unique_id = f"{amp_instance.mac}_volume_step"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, amp_instance.mac)},
-            "name": name,
-            "manufacturer": "Sinilink",
-            "model": "Amplifier",
-            "connections": {("mac", amp_instance.mac)},
-        }
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, amp_instance.mac)},
+            name=name,
+            manufacturer="Sinilink",
+            model="Amplifier",
+            connections={("mac", amp_instance.mac)},
+        )
 
     @property
     def native_value(self) -> float | None:
@@ -54,18 +54,18 @@ class SinilinkRSSISensor(SensorEntity):
         """Return the state of the sensor."""
         
         # Try both connectable and non-connectable
-        service_info = async_last_service_info(self.hass, self._mac, connectable=False)
+        service_info = async_last_service_info(self.hass, self._instance.address, connectable=False)
         if not service_info:
-            service_info = async_last_service_info(self.hass, self._mac, connectable=True)
+            service_info = async_last_service_info(self.hass, self._instance.address, connectable=True)
 
         if service_info and hasattr(service_info, 'rssi') and service_info.rssi is not None:
             self._last_rssi = service_info.rssi
             return self._last_rssi
             
         # Fallback to bleak device if async_last_service_info fails
-        ble_device = bluetooth.async_ble_device_from_address(self.hass, self._mac, connectable=False)
+        ble_device = bluetooth.async_ble_device_from_address(self.hass, self._instance.address, connectable=False)
         if not ble_device:
-            ble_device = bluetooth.async_ble_device_from_address(self.hass, self._mac, connectable=True)
+            ble_device = bluetooth.async_ble_device_from_address(self.hass, self._instance.address, connectable=True)
 
         if ble_device:
             if hasattr(ble_device, 'details') and isinstance(ble_device.details, dict):
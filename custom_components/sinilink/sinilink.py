@@ -2,9 +2,10 @@
 import asyncio
 import logging
 import random
+import struct
 
 from bleak import BleakClient, BleakScanner
-from bleak_retry_connector import establish_connection
+from bleak_retry_connector import establish_connection, retry_bluetooth_connection_error
 from bleak.exc import BleakError
 
 from homeassistant.components import bluetooth
@@ -15,15 +16,58 @@ WRITE_UUID = "0000ae10-0000-1000-8000-00805f9b34fb"
 NOTIFY_UUID = "0000ae04-0000-1000-8000-00805f9b34fb"
 _LOGGER = logging.getLogger(__name__)
 
+# The amplifier BLE stack needs time to process the CCCD write
+# before it can start accepting data packets.
+NOTIFY_SETTLE_TIME = 2.0
+# Interval between keepalive reads that stop the amplifier dropping an idle link.
+KEEPALIVE_INTERVAL = 20
+
+
+def _with_checksum(data: bytes) -> bytes:
+    """Return data with its one-byte additive checksum appended."""
+    return bytes(data) + bytes((sum(data) & 0xFF,))
+
+
+_VOL_HEADER = b"\x7e\x0f\x1d"
+_VOL_ZEROS = bytes(10)
+_VOL_FRAME = struct.Struct(">3sB10sB")
+
+
+def _build_volume_frame(volume: int) -> bytes:
+    """Return a checksummed volume frame (volume 0 powers the amplifier off)."""
+    # Checksum is sum(_VOL_HEADER) + volume = 0xaa + volume.
+    return _VOL_FRAME.pack(_VOL_HEADER, volume, _VOL_ZEROS, (volume + 0xaa) & 0xFF)
+
+
+# Fixed command frames, checksum included, built once at import time.
+_CMD_TURN_OFF = _build_volume_frame(0)
+_CMD_BLUETOOTH = _with_checksum(bytes.fromhex("7e051400"))
+_CMD_AUX = _with_checksum(bytes.fromhex("7e051600"))
+_CMD_USB = _with_checksum(bytes.fromhex("7e050400"))
+_CMD_TF_CARD = _with_checksum(bytes.fromhex("7e050300"))
+_CMD_PC_AUDIO = _with_checksum(bytes.fromhex("7e051500"))
+_CMD_PLAY_PAUSE = _with_checksum(bytes.fromhex("7e050100"))
+_CMD_NEXT_TRACK = _with_checksum(bytes.fromhex("7e050800"))
+_CMD_PREVIOUS_TRACK = _with_checksum(bytes.fromhex("7e050700"))
+_CMD_TOGGLE_PROMPT_TONE = _with_checksum(bytes.fromhex("7e051800"))
+_CMD_REQUEST_1E = _with_checksum(bytes.fromhex("7e051e00"))
+_CMD_REQUEST_1F = _with_checksum(bytes.fromhex("7e051f00"))
+_CMD_REQUEST_20 = _with_checksum(bytes.fromhex("7e052000"))
+
+
 class SinilinkInstance:
     """Instance of a Sinilink amplifier."""
 
     def __init__(self, mac, hass: HomeAssistant) -> None:
         """Initialize the Sinilink instance."""
         self._mac = mac
+        # HA Bluetooth keys devices by upper-case address; keep _mac as-is for ids.
+        self._address = mac.upper()
         self.hass = hass
         self._device: BleakClient | None = None
         self._is_on = False
+        # True while _is_on comes from a status packet rather than a command we sent.
+        self._power_confirmed = False
         self.last_seen = None
         self._volume = 0
         self._source = "AUX"
@@ -36,13 +80,15 @@ class SinilinkInstance:
         self._connect_lock = asyncio.Lock()
         self._write_lock = asyncio.Lock()
         self._buffer = bytearray()
+        self._ready_at = 0.0
+        self._keepalive: asyncio.Task | None = None
 
     def register_callback(self, callback):
         """Register a callback to be called on state updates."""
         if callback not in self._update_callbacks:
             self._update_callbacks.append(callback)
 
-    async def _send_raw(self, payload: bytearray):
+    async def _send_raw(self, payload: bytes):
         """Send raw data to the amplifier without calculating checksum."""
         _LOGGER.debug("Preparing to send raw data to %s", self._mac)
         
@@ -53,39 +99,38 @@ class SinilinkInstance:
                 return
 
         async with self._write_lock:
-            _LOGGER.debug("Final payload to send to %s: %s", self._mac, payload.hex())
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Final payload to send to %s: %s", self._mac, payload.hex())
             try:
-                await self._device.write_gatt_char(WRITE_UUID, payload)
-                await asyncio.sleep(0.1)
+                await self._write(payload)
             except BleakError as e:
-                _LOGGER.warning("BleakError during write to %s: %s. Attempting to reconnect and retry", self._mac, e)
-                if await self.connect():
-                    _LOGGER.debug("Reconnected to %s successfully. Retrying write", self._mac)
-                    try:
-                        await self._device.write_gatt_char(WRITE_UUID, payload)
-                        await asyncio.sleep(0.1)
-                    except BleakError as e_retry:
-                        _LOGGER.error("BleakError on retry write to %s after reconnect: %s", self._mac, e_retry)
-                    except Exception as e_retry_other:
-                        _LOGGER.error("Unexpected error on retry write to %s after reconnect: %s", self._mac, e_retry_other)
-                else:
-                    _LOGGER.error("Failed to reconnect to %s after write error", self._mac)
+                _LOGGER.error("BleakError during write to %s: %s", self._mac, e)
             except Exception as e:
                 _LOGGER.error("Unexpected error during write to %s: %s", self._mac, e)
 
+    @retry_bluetooth_connection_error(2)
+    async def _write(self, payload: bytes):
+        """Write a payload, reconnecting first if the link was dropped."""
+        if not self._device or not self._device.is_connected:
+            _LOGGER.debug("Device %s not connected, reconnecting before write", self._mac)
+            if not await self.connect():
+                raise BleakError(f"Failed to reconnect to {self._mac}")
+        delay = self._ready_at - self.hass.loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        await self._device.write_gatt_char(WRITE_UUID, payload)
+        await asyncio.sleep(0.1)
+
     async def _send(self, data: bytearray):
         """Send data to the amplifier (calculates and appends checksum)."""
-        checksum = sum(data) & 0xFF
-        payload = bytearray(data)
-        payload.append(checksum)
-
-        await self._send_raw(payload)
+        await self._send_raw(_with_checksum(data))
 
     async def _notification_handler(self, sender: int, data: bytearray):
         """Handle incoming notifications with robust buffering."""
         self.last_seen = dt_util.utcnow()
-        hex_string = ''.join(format(x, ' 03x') for x in data)
-        _LOGGER.debug("RAW Notification from %s: %s", self._mac, hex_string)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            hex_string = ''.join(format(x, ' 03x') for x in data)
+            _LOGGER.debug("RAW Notification from %s: %s", self._mac, hex_string)
 
         self._buffer.extend(data)
         
@@ -109,7 +154,8 @@ class SinilinkInstance:
             packet = self._buffer[:packet_len]
             self._buffer = self._buffer[packet_len:]
             
-            _LOGGER.debug("Parsed complete packet: %s", packet.hex())
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Parsed complete packet: %s", packet.hex())
             self._process_packet(packet)
 
     def _process_packet(self, data: bytearray):
@@ -127,6 +173,7 @@ class SinilinkInstance:
                     self._saved_volume = volume
                 self._volume = volume
                 self._is_on = (volume > 0)
+                self._power_confirmed = True
                 _LOGGER.debug("Volume update from %s: %d", self._mac, volume)
         elif packet_type == 0x0f:
             source_byte = data[4]
@@ -177,12 +224,18 @@ class SinilinkInstance:
         _LOGGER.debug("%s: Disconnected", self._mac)
         self._device = None
         self._is_on = False
+        self._power_confirmed = False
 
     @property
     def mac(self):
         """Return the MAC address."""
         return self._mac
 
+    @property
+    def address(self):
+        """Return the upper-case Bluetooth address used for HA lookups."""
+        return self._address
+
     @property
     def source(self):
         """Return the current source."""
@@ -221,66 +274,55 @@ class SinilinkInstance:
             self._eq_mode = str(eq_mode)
 
     async def set_volume(self, intensity: int):
-        """Set the volume of the amplifier."""
+        """Set the volume of the amplifier (0 powers it off, anything else on)."""
         volume = int(intensity)
-
-        header = bytes.fromhex("7e0f1d")
-        command = (volume).to_bytes(1, 'big')
-        params = bytes.fromhex("00000000000000000000")
-
-        await self._send(header + command + params)
+        self._is_on = volume > 0
+        self._power_confirmed = False
+        await self._send_raw(_build_volume_frame(volume))
         self._volume = intensity
 
     async def turn_on(self):
         """Turn on the amplifier."""
+        if self._is_on and self._power_confirmed:
+            return
         self._is_on = True
+        self._power_confirmed = False
 
         if self._saved_volume <= 0:
             self._saved_volume = 7
 
         volume = int(self._saved_volume)
-
-        header = bytes.fromhex("7e0f1d")
-        command = (volume).to_bytes(1, 'big')
-        params = bytes.fromhex("00000000000000000000")
-
-        await self._send(header + command + params)
+        await self._send_raw(_build_volume_frame(volume))
         self._volume = volume
 
     async def turn_off(self):
         """Turn off the amplifier."""
+        if not self._is_on and self._power_confirmed:
+            return
         self._is_on = False
+        self._power_confirmed = False
 
-        header = bytes.fromhex("7e0f1d")
-        command = bytes.fromhex("00")
-        params = bytes.fromhex("00000000000000000000")
-
-        await self._send(header + command + params)
+        await self._send_raw(_CMD_TURN_OFF)
 
     async def bluetooth(self):
         """Switch to Bluetooth source."""
-        command = bytes.fromhex("7e051400")
-        await self._send(command)
+        await self._send_raw(_CMD_BLUETOOTH)
 
     async def aux(self):
         """Switch to AUX source."""
-        command = bytes.fromhex("7e051600")
-        await self._send(command)
+        await self._send_raw(_CMD_AUX)
 
     async def usb(self):
         """Switch to USB source."""
-        command = bytes.fromhex("7e050400")
-        await self._send(command)
+        await self._send_raw(_CMD_USB)
 
     async def tf_card(self):
         """Switch to TF Card source."""
-        command = bytes.fromhex("7e050300")
-        await self._send(command)
+        await self._send_raw(_CMD_TF_CARD)
 
     async def pc_audio(self):
         """Switch to PC Audio source."""
-        command = bytes.fromhex("7e051500")
-        await self._send(command)
+        await self._send_raw(_CMD_PC_AUDIO)
 
     async def set_eq_mode(self, mode: str):
         """Set EQ mode."""
@@ -291,8 +333,7 @@ class SinilinkInstance:
 
     async def play_pause(self):
         """Toggle Play/Pause command."""
-        command = bytes.fromhex("7e050100")
-        await self._send(command)
+        await self._send_raw(_CMD_PLAY_PAUSE)
 
     async def play(self):
         """Send Play command."""
@@ -306,13 +347,11 @@ class SinilinkInstance:
 
     async def next_track(self):
         """Send Next Track command."""
-        command = bytes.fromhex("7e050800")
-        await self._send(command)
+        await self._send_raw(_CMD_NEXT_TRACK)
 
     async def previous_track(self):
         """Send Previous Track command."""
-        command = bytes.fromhex("7e050700")
-        await self._send(command)
+        await self._send_raw(_CMD_PREVIOUS_TRACK)
 
     async def request_system_settings(self):
         """Request system settings like prompt tone and password."""
@@ -332,16 +371,15 @@ class SinilinkInstance:
             _LOGGER.debug("Read after AA failed: %s", e)
             
         await asyncio.sleep(0.6)
-        await self._send(bytes.fromhex("7e051e00"))
+        await self._send_raw(_CMD_REQUEST_1E)
         await asyncio.sleep(1.2)
-        await self._send(bytes.fromhex("7e051f00"))
+        await self._send_raw(_CMD_REQUEST_1F)
         await asyncio.sleep(1.2)
-        await self._send(bytes.fromhex("7e052000"))
+        await self._send_raw(_CMD_REQUEST_20)
 
     async def toggle_prompt_tone(self):
         """Toggle the prompt tone."""
-        command = bytes.fromhex("7e051800")
-        await self._send(command)
+        await self._send_raw(_CMD_TOGGLE_PROMPT_TONE)
 
     async def connect(self) -> bool:
         """Connect to the amplifier."""
@@ -351,7 +389,7 @@ class SinilinkInstance:
                 _LOGGER.debug("Already connected to %s", self._mac)
                 return True
 
-            ble_device = bluetooth.async_ble_device_from_address(self.hass, self._mac, connectable=True)
+            ble_device = bluetooth.async_ble_device_from_address(self.hass, self._address, connectable=True)
             if not ble_device:
                 _LOGGER.error("Device with MAC %s not found by Home Assistant Bluetooth", self._mac)
                 return False
@@ -359,20 +397,21 @@ class SinilinkInstance:
             self._device = await establish_connection(
                     BleakClient,
                     ble_device,
-                    self._mac,
+                    self._address,
                     disconnected_callback=self._on_disconnected,
                     max_attempts=5,
             )
 
             if self._device and self._device.is_connected:
                 _LOGGER.info("Successfully connected to %s", self._mac)
+                self._power_confirmed = False
 
                 try:
                     await self._device.start_notify(NOTIFY_UUID, self._notification_handler)
-                    # The amplifier BLE stack needs time to process the CCCD write 
-                    # before it can start accepting data packets. Give it 2.0s.
-                    await asyncio.sleep(2.0)
+                    # Only the first write has to wait for the CCCD to settle.
+                    self._ready_at = self.hass.loop.time() + NOTIFY_SETTLE_TIME
                     self.hass.loop.create_task(self.request_system_settings())
+                    self._start_keepalive()
                 except BleakError as e:
                     _LOGGER.warning("BleakError during start_notify for %s: %s", self._mac, e)
                 except Exception as e:
@@ -383,9 +422,43 @@ class SinilinkInstance:
             _LOGGER.error("Failed to connect to %s", self._mac)
             return False
 
+    def _start_keepalive(self) -> None:
+        """(Re)start the keepalive task for the current connection."""
+        self._stop_keepalive()
+        self._keepalive = self.hass.async_create_background_task(
+            self._keepalive_loop(), name=f"sinilink-keepalive-{self._mac}"
+        )
+
+    def _stop_keepalive(self) -> None:
+        """Cancel the keepalive task if it is running."""
+        if self._keepalive is not None:
+            self._keepalive.cancel()
+            self._keepalive = None
+
+    async def _keepalive_loop(self):
+        """Periodically read a characteristic so the link is not dropped while on."""
+        while True:
+            await asyncio.sleep(KEEPALIVE_INTERVAL)
+            if not self._device or not self._device.is_connected:
+                break
+            if not self._is_on:
+                continue
+            async with self._write_lock:
+                try:
+                    await self._device.read_gatt_char(WRITE_UUID)
+                except BleakError as e:
+                    _LOGGER.debug("Keepalive read from %s failed: %s", self._mac, e)
+                    break
+                except Exception as e:
+                    _LOGGER.debug("Unexpected error during keepalive read from %s: %s", self._mac, e)
+                    break
+        self._keepalive = None
+
     async def disconnect(self):
         """Disconnect from the amplifier."""
         _LOGGER.debug("Disconnecting from %s", self._mac)
+        self._stop_keepalive()
+        self._power_confirmed = False
         if self._device and self._device.is_connected:
             try:
                 await self._device.disconnect()
@@ -6,6 +6,7 @@ import logging
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.const import CONF_MAC, CONF_NAME
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import DOMAIN
@@ -35,6 +36,14 @@ class SinilinkPromptToneSwitch(SwitchEntity, RestoreEntity):
         self._amp = amp_instance
         self._name = f"{name} Prompt Tone"
         self._hass = amp_instance.hass
+        self._attr_unique_id = f"{amp_instance.mac}_prompt_tone"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, amp_instance.mac)},
+            name=name,
+            manufacturer="Sinilink",
+            model="Amplifier",
+            connections={("mac", amp_instance.mac)},
+        )
         self._amp.register_callback(self.async_schedule_update_ha_state)
 
     @property
@@ -47,22 +56,6 @@ class SinilinkPromptToneSwitch(SwitchEntity, RestoreEntity):
         """Return true if the prompt tone is on."""
         return self._amp.prompt_tone
 
-    @property
-    def device_info(self):
-        """Return device information for device registry."""
-        return {
-            "identifiers": {(DOMAIN, self._amp.mac)},
-            "name": self._name.replace(" Prompt Tone", ""),
-            "manufacturer": "Sinilink",
-            "model": "Amplifier",
-            "connections": {("mac", self._amp.mac)},
-        }
-
-    @property
-    def unique_id(self):
-        """Return a unique ID for this entity."""
-        return f"{self._amp.mac}_prompt_tone"
-
     async def async_added_to_hass(self) -> None:
         """Restore last known state on HA startup."""
         await super().async_added_to_hass()